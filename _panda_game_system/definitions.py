@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from contextlib import contextmanager
 from math import radians, degrees
 from os import path
@@ -22,13 +23,15 @@ from .signals import RegisterPhysicsNode, DeregisterPhysicsNode
 
 
 def entity_from_nodepath(nodepath):
-    if not nodepath.has_python_tag("entity"):
-        return None
-
+    # Untagged nodes return None
     return nodepath.get_python_tag("entity")
 
 
 get_hit_fraction = methodcaller("get_hit_fraction")
+all_collision_mask = BitMask32.all_on()
+
+# World basis vectors, indexed by Axis
+axis_vectors = Vec3(1, 0, 0), Vec3(0, 1, 0), Vec3(0, 0, 1)
 
 
 class BoundVector(Vector):
@@ -139,11 +142,12 @@ class PandaPhysicsInterface(PandaComponent):
         if distance:
             direction = target - source
             direction.length = distance
+            direction += source
 
-            target = source + direction
+            target = direction
 
         if mask is None:
-            collision_mask = BitMask32.all_on()
+            collision_mask = all_collision_mask
 
         else:
             collision_mask = BitMask32()
@@ -194,28 +198,31 @@ class PandaPhysicsInterface(PandaComponent):
 
     @suspended.setter
     def suspended(self, value):
-        if value == self.suspended:
-            return
+        suspended_mass = self._suspended_mass
 
         if value:
+            if suspended_mass is not None:
+                return
+
             self._suspended_mass = self._node.get_mass()
             self._node.set_mass(0.0)
 
-        else:
-            self._node.set_mass(self._suspended_mass)
+        elif suspended_mass is not None:
+            self._node.set_mass(suspended_mass)
             self._suspended_mass = None
 
     @property
     def mass(self):
-        if self.suspended:
-            return self._suspended_mass
+        suspended_mass = self._suspended_mass
+        if suspended_mass is not None:
+            return suspended_mass
 
         else:
             return self._node.get_mass()
 
     @mass.setter
     def mass(self, value):
-        if self.suspended:
+        if self._suspended_mass is not None:
             self._suspended_mass = value
 
         else:
@@ -375,11 +382,8 @@ class PandaTransformInterface(PandaComponent, SignalListener, PandaParentableBas
         :param axis: :py:class:`game_system.enums.Axis` value
         :rtype: :py:class:`game_system.coordinates.Vector`
         """
-        direction = Vec3(0, 0, 0)
-        direction[axis] = 1
-
         rotation = self._nodepath.getQuat()
-        direction = rotation.xform(direction)
+        direction = rotation.xform(axis_vectors[axis])
 
         return Vector(direction)
 
@@ -387,6 +391,8 @@ class PandaTransformInterface(PandaComponent, SignalListener, PandaParentableBas
 @with_tag("navmesh")
 class PandaNavmeshInterface(PandaComponent):
 
+    max_cached_paths = 256
+
     def __init__(self, config_section, entity, nodepath):
         super().__init__()
 
@@ -409,6 +415,9 @@ class PandaNavmeshInterface(PandaComponent):
         self._astar = NavmeshAStarAlgorithm()
         self._funnel = FunnelAlgorithm()
 
+        # Navmesh geometry is static, so A* node paths remain valid once found
+        self._node_paths = OrderedDict()
+
     @property
     def random_point(self):
         node = get_random_polygon(self.nodes)
@@ -502,7 +511,23 @@ class PandaNavmeshInterface(PandaComponent):
         if to_node is None:
             to_node = self.find_nearest_node(to_point)
 
-        nodes = self._astar.find_path(goal=to_node, start=from_node)
+        node_paths = self._node_paths
+        key = from_node, to_node
+
+        try:
+            nodes = node_paths[key]
+
+        except KeyError:
+            nodes = node_paths[key] = self._astar.find_path(goal=to_node, start=from_node)
+
+            if len(node_paths) > self.max_cached_paths:
+                node_paths.popitem(last=False)
+
+        else:
+            node_paths.move_to_end(key)
+
+        # Callers own the returned node list
+        nodes = list(nodes)
         points = self._funnel.find_path(source=from_point, destination=to_point, nodes=nodes)
 
         return NavigationPath(points=points, nodes=nodes)
@@ -1,4 +1,3 @@
-from contextlib import contextmanager
 from collections import defaultdict
 
 from panda3d.bullet import BulletWorld, BulletDebugNode
@@ -223,34 +222,6 @@ class PandaClientPhysicsSystem(PandaPhysicsSystem):
             actor.physics.world_velocity = velocity
             actor.transform.world_orientation = slerped_orientation
 
-    @contextmanager
-    def protect_exemptions(self, exemptions):
-        """Suspend and restore state of exempted actors around an operation
-
-        :param exemptions: Iterable of exempt Actor instances
-        """
-        # Suspend exempted objects
-        already_suspended = set()
-
-        for actor in exemptions:
-            physics = actor.physics
-
-            if physics.suspended:
-                already_suspended.add(physics)
-                continue
-
-            physics.suspended = True
-
-        yield
-
-        # Restore scheduled objects
-        for actor in exemptions:
-            physics = actor.physics
-            if physics in already_suspended:
-                continue
-
-            physics.suspended = False
-
     @PhysicsSingleUpdateSignal.on_global
     def update_for(self, delta_time, target):
         """Listener for PhysicsSingleUpdateSignal
@@ -261,12 +232,27 @@ class PandaClientPhysicsSystem(PandaPhysicsSystem):
         if target.physics.type not in self.active_physics_types:
             return
 
-        # Make a list of actors which aren't us
-        other_actors = Replicable.subclass_of_type(Actor).copy()
-        other_actors.discard(target)
+        # Suspend actors which aren't us, remembering which to restore
+        to_restore = []
+
+        for actor in Replicable.subclass_of_type(Actor):
+            if actor is target:
+                continue
 
-        with self.protect_exemptions(other_actors):
-            self.world.doPhysics(delta_time)
+            physics = actor.physics
+
+            # Static (massless) bodies are never integrated, so suspending them is redundant
+            if physics.suspended or not physics.mass:
+                continue
+
+            physics.suspended = True
+            to_restore.append(physics)
+
+        self.world.doPhysics(delta_time)
+
+        # Restore suspended actors
+        for physics in to_restore:
+            physics.suspended = False
 
     @PhysicsReplicatedSignal.on_global
     def on_physics_replicated(self, timestamp, target):
@@ -53,6 +53,16 @@ class PhysicsInstanceComponent(AbstractPhysicsInstanceComponent, BGEInstanceComp
 
         self._class_component = component
 
+        # Objects without a physics controller raise when velocities are read, not looked up
+        try:
+            game_object.worldLinearVelocity.copy()
+
+        except AttributeError:
+            self._has_dynamics = False
+
+        else:
+            self._has_dynamics = True
+
     @property
     def mass(self):
         return self._game_object.mass
@@ -63,24 +73,22 @@ class PhysicsInstanceComponent(AbstractPhysicsInstanceComponent, BGEInstanceComp
 
     @property
     def world_velocity(self):
-        try:
-            return self._game_object.worldLinearVelocity.copy()
-
-        except AttributeError:
+        if not self._has_dynamics:
             return Vector()
 
+        return self._game_object.worldLinearVelocity.copy()
+
     @world_velocity.setter
     def world_velocity(self, value):
         self._game_object.worldLinearVelocity = value
 
     @property
     def world_angular(self):
-        try:
-            return self._game_object.worldAngularVelocity.copy()
-
-        except AttributeError:
+        if not self._has_dynamics:
             return Vector()
 
+        return self._game_object.worldAngularVelocity.copy()
+
     @world_angular.setter
     def world_angular(self, value):
         self._game_object.worldAngularVelocity = value
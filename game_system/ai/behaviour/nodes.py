@@ -4,7 +4,6 @@ from network.world_info import WorldInfo
 
 from .behaviour import Node, EvaluationState
 from ...controllers import AIPawnController, PlayerPawnController
-from ...coordinates import Vector
 
 
 class GetNearestPlayerPawn(Node):
@@ -124,16 +123,19 @@ class MoveToTarget(Node):
         """
 
         start = pawn.transform.world_position
+        threshold = self.threshold
 
-        to_first_entry = path[0] - start
+        # Skip points already reached
+        while True:
+            to_first_entry = path[0] - start
 
-        if to_first_entry.length_squared < self.threshold:
-            path.popleft()
+            if to_first_entry.length_squared >= threshold:
+                break
 
-            if path:
-                self.follow_path(start, path, goal)
+            path.popleft()
 
-            return
+            if not path:
+                return
 
         pawn.transform.align_to(to_first_entry)
-        pawn.physics.local_velocity.xy = Vector((0.0, self.movement_speed, 0.0)).xy
\ No newline at end of file
+        pawn.physics.local_velocity.xy = 0.0, self.movement_speed
\ No newline at end of file
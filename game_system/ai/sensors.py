@@ -1,4 +1,4 @@
-from math import radians, tan
+from math import radians, sqrt, tan
 
 from ..coordinates import Vector
 from ..entity import Actor
@@ -21,10 +21,13 @@ class SphericalBounds:
 
     def get_linear_intensity(self, point, falloff_rate):
         offset = (point - self.origin).length
-        if offset > self.radius:
+        return self.get_linear_intensity_at_distance(offset, falloff_rate)
+
+    def get_linear_intensity_at_distance(self, distance, falloff_rate):
+        if distance > self.radius:
             return 0.0
 
-        return 1 - (offset / falloff_rate)
+        return 1 - (distance / falloff_rate)
 
     def get_quadratic_intensity(self, point, falloff_rate):
         offset_sq = (point - self.origin).length_squared
@@ -121,13 +124,14 @@ class ViewCone:
         to_point = point - self.origin
         depth = to_point.dot(self.direction)
 
-        if depth > self.length:
+        # Points behind the origin have no positive radius
+        if depth > self.length or depth <= 0.0:
             return False
 
         radius_at_depth = depth * self._depth_to_radius
-        width = (to_point - depth * self.direction).length
+        width_squared = (to_point - depth * self.direction).length_squared
 
-        return width < radius_at_depth
+        return width_squared < radius_at_depth ** 2
 
 
 class SightInterpreter:
@@ -150,15 +154,20 @@ class SoundSensor(Sensor):
         if pawn is None:
             return
 
-        pawn_position = pawn.transform.world_position
+        bounds = sound.bounds
+        distance_sq = (bounds.origin - pawn.transform.world_position).length_squared
 
-        intensity = sound.bounds.get_linear_intensity(pawn_position, self.distance)
-        if not intensity:
+        # Out of range, avoid the square root
+        if distance_sq > bounds.radius_sq:
             return
 
-        distance = (sound.bounds.origin - pawn_position).length
+        distance = sqrt(distance_sq)
+
+        intensity = bounds.get_linear_intensity_at_distance(distance, self.distance)
+        if not intensity:
+            return
 
-        fact = SensoryLink(sound.bounds.origin, distance, sound)
+        fact = SensoryLink(bounds.origin, distance, sound)
         self._pending_links.append(fact)
 
     def update(self, dt):
@@ -11,6 +11,9 @@ class FiniteStateMachine:
         self._states = set()
         self._transitions = defaultdict(list)
 
+        # Transitions from the current state, updated when the state changes
+        self._state_transitions = self._transitions[None]
+
         self._logger = logger
 
     @property
@@ -30,6 +33,7 @@ class FiniteStateMachine:
             current_state.on_exit()
 
         self._state = state
+        self._state_transitions = self._transitions[state]
 
         if state is not None:
             if self._logger:
@@ -71,9 +75,9 @@ class FiniteStateMachine:
         return involved_transitions
 
     def process_transitions(self):
-        current_state = self.state
+        current_state = self._state
 
-        for transition in self._transitions[current_state]:
+        for transition in self._state_transitions:
             if transition.condition():
                 self.state = transition.to_state
 
@@ -95,6 +99,7 @@ class FiniteStateMachine:
         # Set default state if none set
         if set_default and self._state is None:
             self._state = state
+            self._state_transitions = self._transitions[state]
             state.on_enter()
 
             if self._logger:
@@ -103,6 +108,7 @@ class FiniteStateMachine:
     def remove_state(self, state):
         if self._state is state:
             self._state = None
+            self._state_transitions = self._transitions[None]
 
         self._states.remove(state)
 
@@ -14,15 +14,17 @@ class InputContext:
         self.button_names = action_names
         self.struct_class = create_input_struct(action_names)
 
-    def map_to_actions(self, buttons, keymap):
-        """Remap native state to mapped state"""
-        remapped_buttons = {}
+    def resolve_keymap(self, keymap):
+        """Return (action name, button name) bindings for a keymap, unmapped actions binding to themselves"""
+        return tuple((action_name, keymap.get(action_name, action_name)) for action_name in self.button_names)
 
-        for action_name in self.button_names:
-            button_name = keymap.get(action_name, action_name)
-            remapped_buttons[action_name] = buttons[button_name]
+    def map_to_actions(self, buttons, bindings):
+        """Remap native state to mapped state
 
-        return remapped_buttons
+        :param buttons: native button states
+        :param bindings: bindings returned by resolve_keymap
+        """
+        return {action_name: buttons[button_name] for action_name, button_name in bindings}
 
 
 def create_input_struct(action_names):
@@ -39,23 +41,23 @@ def create_input_struct(action_names):
 
         @classmethod
         def from_input_state(cls, actions_state, mouse_delta):
-            self = cls()
+            return cls().update_from_input_state(actions_state, mouse_delta)
 
+        def update_from_input_state(self, actions_state, mouse_delta):
+            """Overwrite packed state in place, allowing instances to be reused"""
             state_a = self.state_a
             state_b = self.state_b
 
+            pressed = ButtonStates.pressed
+            released = ButtonStates.released
+            held = ButtonStates.held
+
             # Update buttons
             for index, action_name in enumerate(action_names):
                 state = actions_state[action_name]
 
-                if state == ButtonStates.pressed:
-                    state_a[index] = True
-
-                elif state == ButtonStates.released:
-                    state_b[index] = True
-
-                elif state == ButtonStates.held:
-                    state_a[index] = state_b[index] = True
+                state_a[index] = state == pressed or state == held
+                state_b[index] = state == released or state == held
 
             self.mouse_delta_x, self.mouse_delta_y = mouse_delta
             return self
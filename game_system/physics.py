@@ -37,13 +37,16 @@ class ServerNetworkPhysicsManager(INetworkPhysicsManager):
         current_tick = self._world.current_tick
 
         for entity in self._entities:
+            transform = entity.transform
+            physics = entity.physics
+
             physics_state = entity.physics_state
-            physics_state.position = entity.transform.world_position
-            physics_state.orientation = entity.transform.world_orientation
-            physics_state.velocity = entity.physics.world_velocity
-            physics_state.angular = entity.physics.world_angular
+            physics_state.position = transform.world_position
+            physics_state.orientation = transform.world_orientation
+            physics_state.velocity = physics.world_velocity
+            physics_state.angular = physics.world_angular
             physics_state.tick = current_tick
-            physics_state.mass = entity.physics.mass
+            physics_state.mass = physics.mass
 
 
 class ClientNetworkPhysicsManager(INetworkPhysicsManager):
@@ -85,8 +88,9 @@ class ClientNetworkPhysicsManager(INetworkPhysicsManager):
             if actor.roles.local != simulated_proxy:
                 continue
 
-            actor.physics.world_angular = (0, 0, 0)
-            actor.physics.world_velocity = (0, 0, 0)
+            physics = actor.physics
+            physics.world_angular = (0, 0, 0)
+            physics.world_velocity = (0, 0, 0)
 
             try:
                 position, orientation = interpolator.next_sample()
@@ -94,8 +98,9 @@ class ClientNetworkPhysicsManager(INetworkPhysicsManager):
             except ValueError:
                 continue
 
-            actor.transform.world_position = position
-            actor.transform.world_orientation = orientation
+            transform = actor.transform
+            transform.world_position = position
+            transform.world_orientation = orientation
 
     def _update_latency_estimate(self, latency):
         self._latency = latency
@@ -10,7 +10,7 @@ from .enums import InputButtons
 from .input import InputContext
 from .latency_compensation import JitterBuffer
 
-from collections import OrderedDict, deque
+from collections import deque
 from logging import getLogger
 from math import radians, pi, floor
 from os import path
@@ -115,7 +115,7 @@ class Clock(Replicable):
 
     @simulated
     def on_tick(self):
-        self.estimated_elapsed_server += 1 / self.scene.world.tick_rate
+        self.estimated_elapsed_server += self.scene.world.timestep
 
 
 class PawnController(Replicable):
@@ -187,6 +187,7 @@ class PlayerPawnController(PawnController):
 
     MAX_POSITION_ERROR_SQUARED = 0.5
     MAX_ORIENTATION_ANGLE_ERROR_SQUARED = radians(5) ** 2
+    MAX_SENT_STATES = 1024
 
     input_context = InputContext()
     info_class = PlayerReplicationInfo
@@ -210,16 +211,21 @@ class PlayerPawnController(PawnController):
             # ID of move waiting to be verified
             self.pending_validation_move_id = None
             self.last_corrected_move_id = 0
+            self.last_validated_move_id = 0
 
             self.scene.messenger.add_subscriber("tick", self.server_on_tick)
             self.scene.messenger.add_subscriber("post_tick", self.server_validate_last_move)
 
+            scene.player_controllers.append(self)
+
         else:
             self.input_map = self.get_input_map()
+            self.input_bindings = self.input_context.resolve_keymap(self.input_map)
             self.move_id = 0
             self.latest_correction_id = 0
 
-            self.sent_states = OrderedDict()
+            # Ring buffer of sent input states, indexed by move ID
+            self.sent_states = [None] * self.MAX_SENT_STATES
             self.recent_states = deque(maxlen=5)
 
             self.scene.world.messenger.add_subscriber("input_updated", self.client_on_input)
@@ -245,32 +251,43 @@ class PlayerPawnController(PawnController):
         if not pawn:
             return
 
+        sent_states = self.sent_states
+        sent_states_length = self.MAX_SENT_STATES
+
+        # Moves to replay must not have been overwritten in the ring buffer
+        if not 0 <= self.move_id - move_id < sent_states_length or sent_states[move_id % sent_states_length] is None:
+            self.logger.warning("Dropping correction for unavailable move: {}".format(move_id))
+            return
+
+        transform = pawn.transform
+        physics = pawn.physics
+
         # Restore pawn state
-        pawn.transform.world_position = position
-        pawn.physics.world_velocity = velocity
+        transform.world_position = position
+        physics.world_velocity = velocity
 
         # Recreate Z rotation
-        orientation = pawn.transform.world_orientation
+        orientation = transform.world_orientation
         orientation.z = yaw # TODO is this safe for QUATS
-        pawn.transform.world_orientation = orientation
+        transform.world_orientation = orientation
 
         # Recreate Z angular rotation
-        angular = pawn.physics.world_angular
+        angular = physics.world_angular
         angular.z = angular_yaw
-        pawn.physics.world_angular = angular
+        physics.world_angular = angular
 
         process_inputs = self.process_inputs
-        sent_states = self.sent_states
+        tick_physics = pawn.tick_physics
 
         # Correcting move
         self.logger.info("Correcting an invalid move: {}".format(move_id))
 
         for move_id in range(move_id, self.move_id + 1):
-            state = sent_states[move_id]
+            state = sent_states[move_id % sent_states_length]
             action_states, mouse_delta = state.to_input_state()
 
             process_inputs(action_states, mouse_delta)
-            pawn.tick_physics()
+            tick_physics()
 
         # Remember this correction, so that older moves are not corrected
         self.latest_correction_id = move_id
@@ -280,11 +297,12 @@ class PlayerPawnController(PawnController):
         pawn = self.pawn
 
         # We must have a valid Pawn
-        if self.pawn is None:
+        if pawn is None:
             return
 
-        position = pawn.transform.world_position
-        yaw = pawn.transform.world_orientation.z
+        transform = pawn.transform
+        position = transform.world_position
+        yaw = transform.world_orientation.z
 
         self.server_receive_move(self.move_id, self.latest_correction_id, self.recent_states, position, yaw)
 
@@ -298,7 +316,10 @@ class PlayerPawnController(PawnController):
 
     def on_destroyed(self):
         if self.scene.world.netmode == Netmodes.server:
-            self.scene.messenger.remove_subscriber("tick", self.on_tick)
+            self.scene.player_controllers.remove(self)
+
+            self.scene.messenger.remove_subscriber("tick", self.server_on_tick)
+            self.scene.messenger.remove_subscriber("post_tick", self.server_validate_last_move)
 
         else:
             self.scene.world.messenger.remove_subscriber("input_updated", self.client_on_input)
@@ -318,11 +339,7 @@ class PlayerPawnController(PawnController):
 
         # Broadcast to all controllers
         if info is None:
-            for replicable in self.scene.replicables.values():
-                if not isinstance(replicable, PlayerReplicationInfo):
-                    continue
-
-                controller = replicable.owner
+            for controller in self.scene.player_controllers:
                 controller.client_handle_message(message, self_info)
 
         else:
@@ -360,6 +377,10 @@ class PlayerPawnController(PawnController):
         except KeyError:
             pass
 
+        # Moves arriving after a later move was validated can never be validated
+        if move_id <= self.last_validated_move_id:
+            return
+
         # Save physics state for this move for later validation
         self.client_moves_states[move_id] = position, yaw, latest_correction_id
 
@@ -390,10 +411,11 @@ class PlayerPawnController(PawnController):
 
         moves_states = self.client_moves_states
 
-        # Delete old move states
-        old_move_ids = [i for i in moves_states if i < move_id]
-        for old_move_id in old_move_ids:
-            moves_states.pop(old_move_id)
+        # Delete old move states, which lie between the last validated move and this one
+        for old_move_id in range(self.last_validated_move_id + 1, move_id):
+            moves_states.pop(old_move_id, None)
+
+        self.last_validated_move_id = move_id
 
         # Get corrected state
         client_position, client_yaw, client_last_correction = moves_states.pop(move_id)
@@ -403,17 +425,21 @@ class PlayerPawnController(PawnController):
             return
 
         # Check predicted position is valid
-        position = pawn.transform.world_position
-        velocity = pawn.physics.world_velocity
-        yaw = pawn.transform.world_orientation.z
-        angular_yaw = pawn.physics.world_angular.z
+        transform = pawn.transform
+        position = transform.world_position
+        yaw = transform.world_orientation.z
+
+        is_invalid = (client_position - position).length_squared > self.MAX_POSITION_ERROR_SQUARED
 
-        pos_err = (client_position - position).length_squared > self.MAX_POSITION_ERROR_SQUARED
-        abs_yaw_diff = ((client_yaw - yaw) % pi) ** 2
-        rot_err = min(abs_yaw_diff, pi - abs_yaw_diff) > self.MAX_ORIENTATION_ANGLE_ERROR_SQUARED
+        # Orientation only matters if position is valid
+        if not is_invalid:
+            abs_yaw_diff = ((client_yaw - yaw) % pi) ** 2
+            is_invalid = min(abs_yaw_diff, pi - abs_yaw_diff) > self.MAX_ORIENTATION_ANGLE_ERROR_SQUARED
 
-        if pos_err or rot_err:
-            self.client_correct_move(move_id, position, yaw, velocity, angular_yaw)
+        if is_invalid:
+            # Velocities are only needed to correct the client
+            physics = pawn.physics
+            self.client_correct_move(move_id, position, yaw, physics.world_velocity, physics.world_angular.z)
             self.last_corrected_move_id = move_id
 
     def client_on_input(self, input_manager):
@@ -421,12 +447,22 @@ class PlayerPawnController(PawnController):
 
         :param input_manager: input manager for world
         """
-        action_states = self.input_context.map_to_actions(input_manager.buttons_state, self.input_map)
+        action_states = self.input_context.map_to_actions(input_manager.buttons_state, self.input_bindings)
         mouse_delta = input_manager.mouse_delta
-        packed_state = self.input_context.struct_class.from_input_state(action_states, mouse_delta)
-
         self.move_id += 1
-        self.sent_states[self.move_id] = packed_state
+
+        # Reuse the state from MAX_SENT_STATES moves ago, which is no longer referenced
+        sent_states = self.sent_states
+        index = self.move_id % self.MAX_SENT_STATES
+        packed_state = sent_states[index]
+
+        if packed_state is None:
+            packed_state = self.input_context.struct_class.from_input_state(action_states, mouse_delta)
+            sent_states[index] = packed_state
+
+        else:
+            packed_state.update_from_input_state(action_states, mouse_delta)
+
         self.recent_states.appendleft(packed_state)
 
         self.process_inputs(action_states, mouse_delta)
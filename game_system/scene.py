@@ -19,6 +19,9 @@ class Scene(_Scene):
         self.network_physics_manager = create_network_physics_manager(world)
         self.entity_builder = self._create_entity_builder()
 
+        # Server-side player controllers, for broadcasting
+        self.player_controllers = []
+
         self.messenger.add_subscriber("replicable_created", self._on_replicable_created)
         self.messenger.add_subscriber("replicable_removed", self._on_replicable_destroyed)
 
@@ -41,7 +44,7 @@ class Scene(_Scene):
 
     def _on_tick(self):
         self.network_physics_manager.tick()
-        self.timer_manager.update(1 / self.world.tick_rate)
+        self.timer_manager.update(self.world.timestep)
 
     def tick(self):
         self.messenger.send("tick")
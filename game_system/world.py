@@ -13,6 +13,7 @@ class World(_World):
         self.timer_manager = TimerManager()
 
         self._tick_rate = tick_rate
+        self._timestep = 1 / tick_rate
         self._current_tick = 0
 
         if netmode == Netmodes.client:
@@ -29,11 +30,16 @@ class World(_World):
     def tick_rate(self):
         return self._tick_rate
 
+    @property
+    def timestep(self):
+        """Duration of a single tick, in seconds"""
+        return self._timestep
+
     def _create_input_manager(self):
         raise NotImplementedError
 
     def _on_tick(self):
-        self.timer_manager.update(1 / self._tick_rate)
+        self.timer_manager.update(self._timestep)
 
         for scene in self.scenes.values():
             scene.tick()
@@ -1,5 +1,3 @@
-from functools import lru_cache
-
 from .type_serialisers import get_serialiser_for
 
 __all__ = ['PacketCollection', 'Packet']
@@ -151,7 +149,7 @@ class Packet(NetworkPacketBase):
 
     Supports protocol and length header
     """
-    __slots__ = "protocol", "payload", "reliable", "on_success", "on_failure"
+    __slots__ = "protocol", "payload", "reliable", "on_success", "on_failure", "_bytes"
 
     _protocol_handler = get_serialiser_for(int)
 
@@ -165,6 +163,8 @@ class Packet(NetworkPacketBase):
         self.payload = payload
         self.reliable = reliable
 
+        self._bytes = None
+
     @property
     def size(self):
         """Length of packet when reduced to bytes"""
@@ -186,14 +186,19 @@ class Packet(NetworkPacketBase):
         if callable(self.on_failure):
             self.on_failure()
 
-    @lru_cache()
     def to_bytes(self):
         """Reduces packet into bytes
 
         :rtype: bytes
         """
-        data = self._protocol_handler.pack(self.protocol) + self.payload
-        return create_group(data)
+        # Reliable packets are resent, so remember the result
+        bytes_string = self._bytes
+
+        if bytes_string is None:
+            data = self._protocol_handler.pack(self.protocol) + self.payload
+            bytes_string = self._bytes = create_group(data)
+
+        return bytes_string
 
     @classmethod
     def from_bytes(cls, bytes_string):
@@ -234,6 +239,7 @@ class Packet(NetworkPacketBase):
         # Read packet protocol
         self.protocol, protocol_size = protocol_handler.unpack_from(bytes_string)
         self.payload = bytes_string[protocol_size:]
+        self._bytes = None
 
         return remainder
 
@@ -2,6 +2,7 @@ from itertools import islice, tee
 
 
 class LazyIterable:
+    __slots__ = "_get_iterable", "_iterable_result"
 
     def __init__(self, get_iterable):
         self._get_iterable = get_iterable
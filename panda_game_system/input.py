@@ -1,5 +1,6 @@
 from game_system.input import InputManagerBase
 from panda3d.core import WindowProperties
+from direct.showbase.DirectObject import DirectObject
 
 from game_system.enums import ButtonStates, InputButtons
 from game_system.coordinates import Vector
@@ -38,6 +39,14 @@ class InputManager(InputManagerBase):
         super().__init__(world)
 
         self._down_events = set()
+        self._window_state = None
+
+        # Window changes (focus, re-creation) may reset mouse properties
+        self.listener = DirectObject()
+        self.listener.accept('window-event', self._on_window_event)
+
+    def _on_window_event(self, window):
+        self._window_state = None
 
     def tick(self):
         # Select appropriate mouse mode
@@ -50,11 +59,15 @@ class InputManager(InputManagerBase):
         else:
             mouse_mode = WindowProperties.M_absolute
 
-        # Set mouse mode
-        props = WindowProperties()
-        props.set_mouse_mode(mouse_mode)
-        props.set_cursor_hidden(not self.mouse_visible)
-        base.win.requestProperties(props)
+        # Set mouse mode, only requesting window changes when needed
+        window_state = mouse_mode, not self.mouse_visible
+        if window_state != self._window_state:
+            props = WindowProperties()
+            props.set_mouse_mode(mouse_mode)
+            props.set_cursor_hidden(not self.mouse_visible)
+            base.win.requestProperties(props)
+
+            self._window_state = window_state
 
         # Get mouse position
         mouse_node = base.mouseWatcherNode
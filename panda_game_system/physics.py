@@ -15,6 +15,7 @@ loadPrcFileData('', 'bullet-enable-contact-events true')
 
 
 class ContactResult:
+    __slots__ = "world", "body_a", "body_b", "contacts_a", "contacts_b", "_contact_result"
 
     def __init__(self, world, body_a, body_b):
         self.world = world
@@ -86,6 +87,9 @@ class PhysicsManager:
         self.tracked_contacts = defaultdict(int)
         self.existing_collisions = set()
 
+        # Pairs whose contact count changed since last dispatch
+        self._changed_contacts = set()
+
         # Debugging info
         debug_node = BulletDebugNode('Debug')
         debug_node.showWireframe(True)
@@ -99,16 +103,25 @@ class PhysicsManager:
         self.debug_nodepath.show()
 
     def _on_contact_removed(self, node_a, node_b):
-        self.tracked_contacts[(node_a, node_b)] -= 1
+        pair = node_a, node_b
+        self.tracked_contacts[pair] -= 1
+        self._changed_contacts.add(pair)
 
     def _on_contact_added(self, node_a, node_b):
-        self.tracked_contacts[(node_a, node_b)] += 1
+        pair = node_a, node_b
+        self.tracked_contacts[pair] += 1
+        self._changed_contacts.add(pair)
 
     def _dispatch_collisions(self):
         # Dispatch collisions
         existing_collisions = self.existing_collisions
+        tracked_contacts = self.tracked_contacts
+        changed_contacts = self._changed_contacts
+
+        # Only pairs which received contact events can have started or ended colliding
+        for pair in changed_contacts:
+            contact_count = tracked_contacts[pair]
 
-        for pair, contact_count in self.tracked_contacts.items():
             # If is new collision
             if contact_count > 0 and pair not in existing_collisions:
                 existing_collisions.add(pair)
@@ -127,7 +140,13 @@ class PhysicsManager:
                 entity_b.messenger.send("collision_started", entity=entity_a, contacts=contact_result.contacts_b)
 
             # Ended collision
-            elif contact_count == 0 and pair in existing_collisions:
+            elif contact_count == 0:
+                # Stop tracking pairs which are no longer in contact
+                del tracked_contacts[pair]
+
+                if pair not in existing_collisions:
+                    continue
+
                 existing_collisions.remove(pair)
 
                 # Dispatch collision
@@ -142,6 +161,8 @@ class PhysicsManager:
                 entity_a.messenger.send("collision_stopped", entity_b)
                 entity_b.messenger.send("collision_stopped", entity_a)
 
+        changed_contacts.clear()
+
     def add_entity(self, entity, component):
         body = component.body
         self.world.attach_rigid_body(body)